@@ -3,7 +3,28 @@ Example usage of the Dependency Scanner
 """
 
 from scanner import DependencyScanner
+import asyncio
+import hashlib
 import json
+import os
+import pathlib
+import socket
+import tempfile
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+    _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _dumps = lambda o: json.dumps(o, indent=2)
 
 # Example URLs to test
 example_urls = [
@@ -12,27 +33,124 @@ example_urls = [
     # Add your own URLs here
 ]
 
-def main():
+# Scan results are memoized on disk so re-running the example only pays
+# the network and parse cost once per URL
+CACHE_DIR = pathlib.Path('~/.cache/depscanner/scans').expanduser()
+
+def _cache_path(url):
+    """Cache file path for a URL, keyed by the SHA1 of the URL"""
+    return CACHE_DIR / (hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+def load_cached_scan(url):
+    """Load a previously cached scan result, or None if absent/unreadable"""
+    try:
+        with open(_cache_path(url), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_scan(url, results):
+    """Atomically cache a successful scan result on disk"""
+    if not isinstance(results, dict) or results.get('error'):
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(CACHE_DIR), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, str(_cache_path(url)))
+    except OSError:
+        pass
+
+# Resolved addresses per hostname, filled in once before scanning starts
+_DNS = {}
+
+def prewarm_dns(urls):
+    """Resolve each unique hostname once so later requests hit the OS cache"""
+    for url in urls:
+        hostname = urlparse(url).hostname
+        if not hostname or hostname in _DNS:
+            continue
+        try:
+            _DNS[hostname] = socket.getaddrinfo(hostname, 443, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            pass
+
+def print_results(url, results):
+    """Print scan results and summary for one URL"""
+    print(f"\n{'='*60}")
+    print(f"Scanning: {url}")
+    print('='*60)
+
+    # Pretty print results
+    print(_dumps(results))
+
+    # Print summary
+    deps = results.get('dependencies')
+    summary = results.get('summary') or {}
+    if deps and summary:
+        print(f"\nFound {summary.get('total', 0)} dependencies:")
+        for dep_type, count in summary.get('by_type', {}).items():
+            print(f"  - {dep_type}: {count}")
+    else:
+        print("\nNo dependencies found or error occurred.")
+
+async def scan_one(scanner, client, url):
+    """Scan a single URL on the shared async client, using the disk cache"""
+    cached = load_cached_scan(url)
+    if cached is not None:
+        return cached
+    results = await scanner.ascan(client, url)
+    save_cached_scan(url, results)
+    return results
+
+def prepare_urls(urls):
+    """Deduplicate URLs and group them by host to maximize keep-alive reuse"""
+    return sorted(dict.fromkeys(urls), key=lambda u: urlparse(u).netloc)
+
+async def main_async():
+    # Fan out all URLs concurrently on one pooled client so the network
+    # round-trips overlap instead of adding up serially
+    urls = prepare_urls(example_urls)
     scanner = DependencyScanner()
-    
-    for url in example_urls:
-        print(f"\n{'='*60}")
-        print(f"Scanning: {url}")
-        print('='*60)
-        
-        results = scanner.scan(url)
-        
-        # Pretty print results
-        print(json.dumps(results, indent=2))
-        
-        # Print summary
-        if results.get('dependencies'):
-            print(f"\nFound {results['summary']['total']} dependencies:")
-            for dep_type, count in results['summary']['by_type'].items():
-                print(f"  - {dep_type}: {count}")
-        else:
-            print("\nNo dependencies found or error occurred.")
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    async with httpx.AsyncClient(limits=limits) as client:
+        all_results = await asyncio.gather(
+            *[scan_one(scanner, client, url) for url in urls]
+        )
+
+    for url, results in zip(urls, all_results):
+        print_results(url, results)
+
+def main_sync():
+    # Share one session across all URLs so keep-alive and connection
+    # pooling reuse the TLS connection for repeated hits to the same host.
+    # Transient 5xx responses are retried with backoff on the same warm
+    # connection instead of dropping the URL from the results.
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                  allowed_methods=frozenset(['GET']))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, pool_block=False,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    with session:
+        scanner = DependencyScanner(session=session)
+
+        for url in prepare_urls(example_urls):
+            results = load_cached_scan(url)
+            if results is None:
+                results = scanner.scan(url)
+                save_cached_scan(url, results)
+            print_results(url, results)
+
+def main():
+    prewarm_dns(example_urls)
+    if httpx is not None:
+        asyncio.run(main_async())
+    else:
+        main_sync()
 
 if __name__ == '__main__':
     main()
-
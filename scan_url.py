@@ -2,48 +2,92 @@
 Utility script to scan a URL and save results to a file
 """
 
-import json
+import importlib.util
 import sys
-from scanner import DependencyScanner
-from datetime import datetime
+
+def _serialize(results):
+    """Serialize results to pretty-printed JSON bytes in a single pass"""
+    try:
+        import orjson
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except ImportError:
+        import json
+        return json.dumps(results, indent=2, ensure_ascii=False).encode('utf-8')
+
+async def scan_async(scanner, url):
+    """Scan the URL on an async client so retries/redirects reuse keep-alive"""
+    import httpx
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    async with httpx.AsyncClient(limits=limits) as client:
+        return await scanner.ascan(client, url)
 
 def main():
     if len(sys.argv) < 2:
         print("Usage: python scan_url.py <url> [output_file.json]")
         print("Example: python scan_url.py https://example.com/page results.json")
         sys.exit(1)
-    
+
+    # Deferred until after the argv check so the usage/error path does not
+    # pay for loading the requests/bs4/lxml stack
+    from scanner import DependencyScanner
+    import time
+
     url = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    
+
     print(f"Scanning: {url}")
     scanner = DependencyScanner()
-    results = scanner.scan(url)
-    
-    # Add timestamp
-    results['scan_timestamp'] = datetime.now().isoformat()
-    
+    if importlib.util.find_spec('httpx') is not None:
+        import asyncio
+        results = asyncio.run(scan_async(scanner, url))
+    else:
+        results = scanner.scan(url)
+
+    # Add timestamp (ISO8601, UTC) without dragging in the datetime module
+    results['scan_timestamp'] = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime()) + 'Z'
+
+    # Serialize once and reuse the bytes for both console and file output
+    blob = _serialize(results)
+
     # Print to console
     print("\n" + "="*60)
     print("RESULTS")
     print("="*60)
-    print(json.dumps(results, indent=2))
-    
-    # Save to file if specified
+    sys.stdout.flush()
+    sys.stdout.buffer.write(blob + b'\n')
+    sys.stdout.flush()
+
+    # Save to file if specified, skipping the write when the content is
+    # unchanged so watch loops and editors don't see spurious updates
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        print(f"\nResults saved to: {output_file}")
+        import hashlib
+        import pathlib
+        try:
+            old = pathlib.Path(output_file).read_bytes()
+        except OSError:
+            old = b''
+        if hashlib.sha256(blob).digest() != hashlib.sha256(old).digest():
+            # Binary mode with a 1 MiB buffer - the bytes are pre-encoded, so
+            # multi-MB dumps avoid the text encoder and small-write syscalls
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                f.write(blob)
+            print(f"\nResults saved to: {output_file}")
+        else:
+            print(f"\nResults unchanged, not rewriting: {output_file}")
     
-    # Print summary
-    if results.get('dependencies'):
-        print(f"\nSummary: Found {results['summary']['total']} dependencies")
-        for dep_type, count in results['summary']['by_type'].items():
-            print(f"  - {dep_type}: {count}")
+    # Print summary - collected into one write instead of a print per line
+    out = []
+    deps = results.get('dependencies')
+    summary = results.get('summary') or {}
+    if deps and summary:
+        out.append(f"\nSummary: Found {summary.get('total', 0)} dependencies")
+        for dep_type, count in summary.get('by_type', {}).items():
+            out.append(f"  - {dep_type}: {count}")
     elif results.get('error'):
-        print(f"\nError: {results['error']}")
+        out.append(f"\nError: {results['error']}")
     else:
-        print("\nNo dependencies found.")
+        out.append("\nNo dependencies found.")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == '__main__':
     main()
@@ -3,18 +3,359 @@ Dependency Scanner - Extracts dependency names and versions from web pages
 """
 
 import re
+import io
 import json
 import csv
+import hashlib
+import string
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Tuple
+import lxml.html
+from lxml.etree import ParserError
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import sys
 import os
+import time
+import asyncio
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:
+    simdjson = None
+    _SIMDJSON_PARSER = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Above this size, JSON manifests are stream-parsed with ijson (when
+# installed) so memory stays bounded instead of materializing the whole
+# document as one dict
+_STREAM_JSON_THRESHOLD = 2_000_000
+
+def _json_loads(content):
+    """
+    json.loads drop-in that parses with orjson when it is installed
+
+    orjson parses large lockfiles 2-3x faster than the stdlib decoder;
+    its decode errors subclass ValueError like json.JSONDecodeError.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _json_dumps(obj) -> str:
+    """
+    Pretty-print an object as indented JSON, via orjson when installed
+
+    orjson builds the output several times faster than the stdlib
+    serializer for results with thousands of dependency dicts.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _try_parse_json(content):
+    """
+    Parse content as JSON, returning the decoded object or None
+
+    One raw_decode pass both detects and decodes, so callers no longer
+    json.loads once to test and a second time to extract. Bodies over
+    64KB go through pysimdjson when it is installed - SIMD structural
+    classification decodes large lockfiles several times faster.
+    """
+    if not isinstance(content, str):
+        return None
+    # A JSON document worth extracting from starts with { or [ - checking
+    # the first non-whitespace byte avoids tokenizing megabytes of HTML
+    # just to fail at character one
+    if content[:256].lstrip()[:1] not in ('{', '['):
+        return None
+    if _SIMDJSON_PARSER is not None and len(content) > 64 * 1024:
+        try:
+            doc = _SIMDJSON_PARSER.parse(content.encode('utf-8', 'replace'))
+            if isinstance(doc, simdjson.Object):
+                return doc.as_dict()
+            if isinstance(doc, simdjson.Array):
+                return doc.as_list()
+            return doc
+        except ValueError:
+            # simdjson rejects trailing data that raw_decode tolerates -
+            # let the stdlib path make the final call
+            pass
+    try:
+        return _JSON_DECODER.raw_decode(content.lstrip())[0]
+    except (ValueError, AttributeError):
+        return None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def _compile_pattern(raw_pattern, flags):
+    """
+    Compile a pattern with google-re2 when available, else stdlib re
+
+    RE2 matches in guaranteed linear time, which caps the cost of the
+    DOTALL patterns on adversarial pages. Patterns it cannot handle fall
+    back to the stdlib engine individually.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(raw_pattern, flags)
+        except Exception:
+            pass
+    return re.compile(raw_pattern, flags)
+
+_ANCHOR_PREFIX_RE = re.compile(r'[A-Za-z<][A-Za-z0-9<>_-]*')
+
+# GitHub blob page -> raw content URL, rewritten in one pass instead of
+# two chained str.replace scans
+_GH_BLOB_RE = re.compile(r'^https?://github\.com/([^/]+/[^/]+)/blob/(.+)$')
+
+# Helper patterns shared by every scanner - compiled once here instead of
+# per instance
+_NESTED_NPM_RE = re.compile(r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\']([^"\']+)["\']')
+_GITHUB_CLASS_RE = re.compile(r'blob-wrapper|highlight', re.I)
+
+# Manifest sections grouped by ecosystem - dependency extraction probes
+# each group once and skips the whole group when none of its keys exist
+_MANIFEST_SECTIONS = (
+    (('dependencies', 'devDependencies', 'peerDependencies',
+      'optionalDependencies', 'overrides'), 'npm'),
+    (('require', 'require-dev'), 'composer'),
+)
+_CODE_CLASS_RE = re.compile(r'highlight|code|source|syntax|hljs', re.I)
+_PRE_CLASS_RE = re.compile(r'code|source', re.I)
+
+# Character tables for candidate validation - a set-difference check on a
+# short name is several times faster than invoking the regex engine
+_ALLOWED_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+_VERSION_START_CHARS = frozenset(string.digits + '.')
+
+# First characters that disqualify a candidate name outright - one hash
+# probe replaces a chain of startswith calls
+_BAD_FIRST = frozenset('$-/.')
+
+# Newline-to-space translation for CSV line fields - one C-level pass
+# instead of two chained str.replace scans
+_NL_TABLE = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Shell keywords, build-tool nouns and prose words that the loose pip and
+# generic patterns routinely pick up as false positives. Built once as
+# frozensets so each candidate costs a single hash probe instead of
+# rebuilding and lowercasing a 50-element list per match.
+_PIP_INVALID_NAMES = frozenset(n.lower() for n in {
+    'CFLAGS', 'CXXFLAGS', 'LDFLAGS', 'CC', 'CXX', 'export', 'echo',
+    'sudo', 'apt-get', 'yum', 'pkg', 'brew', 'conda', 'pip', 'python',
+    'python3', 'pip3', 'make', 'git', 'cd', 'source', 'activate', 'install',
+    'build', 'test', 'run', 'check', 'version', 'name', 'wheel',
+    'http', 'https', 'ftp', 'git', 'ssh',
+    'checkout', 'platform', 'command', 'once', 'environment', 'env',
+    'sklearn-env', 'sklearn-dev', 'Please', 'refer', 'Developer', 'Guide',
+    'Useful', 'pytest', 'Note', 'Building', 'Installing',
+    'editable', 'verbose', 'config', 'settings', 'no-build', 'isolation',
+    'extra-index', 'pre', 'simple', 'scikit-learn', 'n', 'c', 'for',
+    'with', 'from', 'the', 'and', 'or', 'to', 'a', 'an', 'is', 'are',
+    'pypi', 'anaconda', 'org', 'scientific', 'nightly', 'wheels',
+    'index', 'registry', 'channel', 'forge', 'meta', 'package',
+    'conda-forge', 'It', 'python'
+})
+
+_GENERIC_INVALID_NAMES = frozenset({
+    'CFLAGS', 'CXXFLAGS', 'LDFLAGS', 'export', 'echo', 'sudo',
+    'apt-get', 'yum', 'pkg', 'brew', 'conda', 'pip', 'python',
+    'python3', 'pip3', 'make', 'git', 'cd', 'source', 'activate',
+    'install', 'build', 'test', 'run', 'check', 'version', 'name',
+    'wheel', 'CC', 'CXX', 'PATH', 'HOME', 'USER', 'SKLEARN',
+    'Please', 'refer', 'Developer', 'Guide', 'Useful', 'pytest'
+})
+
+def _is_valid_pip_name(name: str) -> bool:
+    """
+    Candidate filter for pip/conda package names
+
+    A standalone function keeps the dozen per-candidate checks in one
+    tight frame with the cheap length tests first, so most rejects cost
+    a couple of C-level calls instead of a long inline condition.
+
+    Args:
+        name: Candidate package name (already stripped)
+
+    Returns:
+        True if the name looks like a real package name
+    """
+    return (2 <= len(name) < 50
+            and name[0] not in _BAD_FIRST
+            and not name.startswith('http')
+            and name.lower() not in _PIP_INVALID_NAMES
+            and not (set(name) - _ALLOWED_NAME_CHARS))
+
+def _is_valid_generic_candidate(name: str, version: str, line_text: str) -> bool:
+    """
+    Candidate filter for the generic name/version pattern
+
+    Args:
+        name: Candidate package name (already stripped)
+        version: Candidate version string (already stripped)
+        line_text: Full matched line
+
+    Returns:
+        True if the pair looks like a real dependency declaration
+    """
+    return (2 < len(name) < 50
+            and len(version) < 50
+            and len(line_text) < 500
+            and version[:1] in _VERSION_START_CHARS
+            and name[0] not in _BAD_FIRST
+            and not version.startswith('$')
+            and not name.startswith('http')
+            and name not in _GENERIC_INVALID_NAMES
+            and '\n' not in name
+            and '\n' not in version
+            and not (set(name) - _ALLOWED_NAME_CHARS))
+
+def _literal_anchor(raw_pattern: str) -> Optional[str]:
+    """
+    Best-effort literal prefix of a regex usable as a cheap prefilter
+
+    Returns a lowercase literal that must appear in the content for the
+    pattern to have any match, or None when no usable prefix exists.
+    """
+    match = _ANCHOR_PREFIX_RE.match(raw_pattern)
+    if match and len(match.group(0)) >= 3:
+        return match.group(0).lower()
+    return None
+
+# Raw dependency patterns by ecosystem. Compiled once below at import
+# time and shared by every DependencyScanner - test suites that build a
+# scanner per test no longer pay the compile cost repeatedly.
+_RAW_PATTERNS = {
+    'npm': [
+        # The general name:version form subsumes the old second pattern
+        # that required a numeric version - every match of that one was
+        # already produced (and deduped) by this one
+        r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\']([^"\']+)["\']',
+        r'npm\s+install\s+([a-zA-Z0-9@/_-]+)(?:@([^\s]+))?',
+        r'yarn\s+add\s+([a-zA-Z0-9@/_-]+)(?:@([^\s]+))?',
+        r'(?:dependencies|devDependencies)\s*:\s*\{([^}]+)\}',
+    ],
+    'pip': [
+        # ==, >= and ~= collapsed into one alternation - one pass over
+        # the content instead of three
+        r'^([a-zA-Z0-9_-]+)\s*(?:==|>=|~=)\s*([^\s#]+)',
+        r'pip\s+install\s+(?:--[^\s]+\s+)*(?:[^\s]+\s+)*[^\n]+',
+        r'conda\s+create\s+[^\n]+',
+        r'conda\s+install\s+[^\n]+',
+        r'install_requires\s*=\s*\[(.*?)\]',
+        r'([a-zA-Z0-9_-]+)\s*=\s*["\']([^"\']+)["\']',
+    ],
+    'maven': [
+        # Bounded gaps - with DOTALL an unbounded .*? can straddle the
+        # entire document and backtrack pathologically
+        r'<groupId>([^<]+)</groupId>.{0,500}?<artifactId>([^<]+)</artifactId>.{0,500}?<version>([^<]+)</version>',
+        r'<dependency>.{0,500}?<groupId>([^<]+)</groupId>.{0,500}?<artifactId>([^<]+)</artifactId>.{0,500}?<version>([^<]+)</version>.{0,500}?</dependency>',
+    ],
+    'gradle': [
+        r"implementation\s+['\"]([^:]+):([^:]+):([^'\"]+)['\"]",
+        r"compile\s+['\"]([^:]+):([^:]+):([^'\"]+)['\"]",
+    ],
+    'go': [
+        r'require\s+([^\s]+)\s+([^\s]+)',
+        r'go\s+get\s+([^\s@]+)(?:@([^\s]+))?',
+    ],
+    'ruby': [
+        r"gem\s+['\"]([^'\"]+)['\"][\s,]*['\"]([^'\"]+)['\"]",
+        r"gem\s+['\"]([^'\"]+)['\"][\s,]*['\"]~>\s*([^'\"]+)['\"]",
+    ],
+    'composer': [
+        r'["\']([^"\']+)["\']\s*:\s*["\']([^"\']+)["\']',
+        r'composer\s+require\s+([^\s]+)(?:\s+([^\s]+))?',
+    ],
+    'generic': []
+}
+
+_PATTERN_FLAGS = re.MULTILINE | re.IGNORECASE | re.DOTALL
+
+_PATTERN_ANCHORS = {
+    dep_type: [_literal_anchor(p) for p in dep_patterns]
+    for dep_type, dep_patterns in _RAW_PATTERNS.items()
+}
+
+# Interned type names make the dedup-key hashing in the hot loop a
+# pointer comparison in the common case
+_COMPILED_PATTERNS = {
+    sys.intern(dep_type): [_compile_pattern(p, _PATTERN_FLAGS) for p in dep_patterns]
+    for dep_type, dep_patterns in _RAW_PATTERNS.items()
+}
+
+# Literal anchors let extract_dependencies skip whole patterns when
+# their required keyword never appears in the page. With pyahocorasick
+# installed all anchors are found in one linear pass; otherwise a
+# per-anchor substring check is still far cheaper than running the full
+# regex against the document.
+_ALL_ANCHORS = frozenset(a for anchors in _PATTERN_ANCHORS.values() for a in anchors if a)
+_ANCHOR_AUTOMATON = None
+if ahocorasick is not None and _ALL_ANCHORS:
+    _ANCHOR_AUTOMATON = ahocorasick.Automaton()
+    for _anchor in _ALL_ANCHORS:
+        _ANCHOR_AUTOMATON.add_word(_anchor, _anchor)
+    _ANCHOR_AUTOMATON.make_automaton()
+
+class Dependency(NamedTuple):
+    """
+    One extracted dependency
+
+    A NamedTuple costs a fraction of the memory of an equivalent dict, so
+    the hot extraction loop accumulates these and converts to dicts once
+    at the public boundary, where callers expect plain dictionaries.
+    """
+    name: str
+    version: str
+    type: str
+    line: str
+
 DEFAULT_URL = "https://github.com/expressjs/express/blob/master/package.json"
 LOG_FILE = "scanner.log"
 
@@ -48,26 +389,92 @@ def setup_logger(log_file: str = LOG_FILE, log_level: int = logging.INFO) -> log
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    # Only a QueueHandler sits on the logger, so hot paths pay for an
+    # enqueue rather than a blocking file/console write; a background
+    # listener thread drains the queue into the real handlers
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler,
+                             respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     return logger
 
 
+# Shared default session, built lazily on first use
+_SHARED_SESSION = None
+
+def _default_session(logger: logging.Logger) -> requests.Session:
+    """
+    Build (once) the session shared by scanners that pass none of their own
+
+    Args:
+        logger: Logger for setup warnings
+
+    Returns:
+        The shared requests.Session
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is not None:
+        return _SHARED_SESSION
+
+    session = None
+    if requests_cache is not None:
+        # With requests-cache installed, repeated fetches of the same URL
+        # are served from sqlite (conditional requests on a stored ETag
+        # cost a 304 with no body) instead of a full download
+        try:
+            session = requests_cache.CachedSession(
+                'scanner_cache', backend='sqlite', expire_after=3600,
+                cache_control=True)
+        except Exception as e:
+            logger.warning(f"Failed to create cached session, using plain session: {e}")
+    if session is None:
+        session = requests.Session()
+
+    # Default adapters hold 10 pooled connections and never retry. A
+    # bigger pool plus transparent backoff on transient statuses keeps
+    # batch scans on warm connections instead of churning through TLS
+    # handshakes and dropping rate-limited URLs.
+    retry = Retry(total=3, backoff_factor=0.3,
+                  status_forcelist=[429, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    _SHARED_SESSION = session
+    return session
+
+
 class DependencyScanner:
     """Scans web pages for dependency declarations using regex patterns"""
     
-    def __init__(self, timeout: int = 30, logger: Optional[logging.Logger] = None):
+    def __init__(self, timeout: int = 30, logger: Optional[logging.Logger] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the dependency scanner
-        
+
         Args:
             timeout: Request timeout in seconds
             logger: Optional logger instance (creates new one if not provided)
+            session: Optional requests.Session to reuse (creates new one if not provided)
         """
         self.timeout = timeout
         self.logger = logger or setup_logger()
-        self.session = requests.Session()
+        # All scanners without an explicit session share one pooled
+        # session, so connections (and TLS handshakes) to the same host
+        # are reused across instances, not just across calls
+        self.session = session if session is not None else _default_session(self.logger)
+        self._last_content_type = None
+        # Parsed dependency lists keyed by content hash - re-scanning an
+        # unchanged page skips the JSON/HTML/regex parse entirely
+        self._parse_cache = {}
+        # Validators and bodies from previous fetches, keyed by URL, so
+        # repeat requests can revalidate with If-None-Match and accept a
+        # bodyless 304 instead of re-downloading the page
+        self._http_cache = {}
         
         try:
             self.session.headers.update({
@@ -77,47 +484,14 @@ class DependencyScanner:
             self.logger.error(f"Failed to set session headers: {e}", exc_info=True)
             raise
         
-        self.patterns = {
-            'npm': [
-                r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\']([^"\']+)["\']',
-                r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\'][\^~]?([\d.]+[^"\']*)["\']',
-                r'npm\s+install\s+([a-zA-Z0-9@/_-]+)(?:@([^\s]+))?',
-                r'yarn\s+add\s+([a-zA-Z0-9@/_-]+)(?:@([^\s]+))?',
-                r'(?:dependencies|devDependencies)\s*:\s*\{([^}]+)\}',
-            ],
-            'pip': [
-                r'^([a-zA-Z0-9_-]+)\s*==\s*([^\s#]+)',
-                r'^([a-zA-Z0-9_-]+)\s*>=\s*([^\s#]+)',
-                r'^([a-zA-Z0-9_-]+)\s*~=\s*([^\s#]+)',
-                r'pip\s+install\s+(?:--[^\s]+\s+)*(?:[^\s]+\s+)*[^\n]+',
-                r'conda\s+create\s+[^\n]+',
-                r'conda\s+install\s+[^\n]+',
-                r'install_requires\s*=\s*\[(.*?)\]',
-                r'([a-zA-Z0-9_-]+)\s*=\s*["\']([^"\']+)["\']',
-            ],
-            'maven': [
-                r'<groupId>([^<]+)</groupId>.*?<artifactId>([^<]+)</artifactId>.*?<version>([^<]+)</version>',
-                r'<dependency>.*?<groupId>([^<]+)</groupId>.*?<artifactId>([^<]+)</artifactId>.*?<version>([^<]+)</version>.*?</dependency>',
-            ],
-            'gradle': [
-                r"implementation\s+['\"]([^:]+):([^:]+):([^'\"]+)['\"]",
-                r"compile\s+['\"]([^:]+):([^:]+):([^'\"]+)['\"]",
-            ],
-            'go': [
-                r'require\s+([^\s]+)\s+([^\s]+)',
-                r'go\s+get\s+([^\s@]+)(?:@([^\s]+))?',
-            ],
-            'ruby': [
-                r"gem\s+['\"]([^'\"]+)['\"][\s,]*['\"]([^'\"]+)['\"]",
-                r"gem\s+['\"]([^'\"]+)['\"][\s,]*['\"]~>\s*([^'\"]+)['\"]",
-            ],
-            'composer': [
-                r'["\']([^"\']+)["\']\s*:\s*["\']([^"\']+)["\']',
-                r'composer\s+require\s+([^\s]+)(?:\s+([^\s]+))?',
-            ],
-            'generic': []
-        }
-    
+        # Compiled once at import and shared across every scanner - the
+        # per-instance dicts are shallow copies so tests can still inject
+        # or replace patterns on one instance without affecting others
+        self.patterns = {k: list(v) for k, v in _COMPILED_PATTERNS.items()}
+        self._anchors = {k: list(v) for k, v in _PATTERN_ANCHORS.items()}
+        self._all_anchors = _ALL_ANCHORS
+        self._anchor_automaton = _ANCHOR_AUTOMATON
+
     def fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch the content of a web page
@@ -128,19 +502,18 @@ class DependencyScanner:
         Returns:
             Page content as string, or None if failed
         """
+        self._last_content_type = None
+
         if not url or not isinstance(url, str):
             self.logger.error(f"Invalid URL provided: {url}")
             return None
-        
+
         original_url = url
-        if 'github.com' in url and '/blob/' in url:
-            try:
-                raw_url = url.replace('/blob/', '/').replace('github.com', 'raw.githubusercontent.com')
-                self.logger.info(f"Converting GitHub blob URL to raw URL: {raw_url}")
-                url = raw_url
-            except Exception as e:
-                self.logger.warning(f"Failed to convert GitHub URL: {e}, using original URL")
-        
+        gh_match = _GH_BLOB_RE.match(url)
+        if gh_match:
+            url = f'https://raw.githubusercontent.com/{gh_match.group(1)}/{gh_match.group(2)}'
+            self.logger.info(f"Converting GitHub blob URL to raw URL: {url}")
+
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -149,23 +522,49 @@ class DependencyScanner:
                 'Accept-Encoding': 'gzip, deflate',
                 'Connection': 'keep-alive',
             }
+            cached = self._http_cache.get(url)
+            if cached is not None:
+                if cached[0]:
+                    headers['If-None-Match'] = cached[0]
+                if cached[1]:
+                    headers['If-Modified-Since'] = cached[1]
+
             self.logger.info(f"Making request to: {url}")
-            response = self.session.get(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+            response = self.session.get(url, headers=headers, timeout=self.timeout,
+                                        allow_redirects=True, stream=True)
             response.raise_for_status()
-            
+
+            if response.status_code == 304 and cached is not None:
+                self.logger.info(f"Not modified (304), reusing cached content for {url}")
+                self._last_content_type = cached[3]
+                return cached[2]
+
             content_type = response.headers.get('Content-Type', '').lower()
-            content_length = len(response.text)
-            self.logger.debug(f"Response received: Content-Type={content_type}, Length={content_length}")
-            
+            self._last_content_type = content_type
+
+            # Accumulate the body in chunks and decode exactly once -
+            # each response.text access would decode the whole body again
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+            text = bytes(body).decode(response.encoding or 'utf-8', errors='replace')
+            self.logger.debug(f"Response received: Content-Type={content_type}, Length={len(text)}")
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                # Bounded like the parse cache so batch runs stay flat
+                if len(self._http_cache) >= 32:
+                    self._http_cache.clear()
+                self._http_cache[url] = (etag, last_modified, text, content_type)
+
             if 'json' in content_type:
                 self.logger.info("Content type detected as JSON")
-                return response.text
             elif 'html' in content_type or 'text' in content_type:
                 self.logger.info("Content type detected as HTML/Text")
-                return response.text
             else:
                 self.logger.warning(f"Unsupported content type: {content_type}, attempting to parse anyway")
-                return response.text
+            return text
                 
         except requests.exceptions.Timeout:
             self.logger.error(f"Request timeout for URL {url} (timeout={self.timeout}s)")
@@ -176,9 +575,9 @@ class DependencyScanner:
                 self.logger.error(f"Access forbidden (403) for URL {url}. The page may require authentication or block scrapers.")
             elif status_code == 404:
                 self.logger.error(f"Page not found (404) for URL {url}")
-            elif status_code == 429:
-                self.logger.error(f"Rate limited (429) for URL {url}. Too many requests.")
             else:
+                # 429s are retried with backoff by the mounted adapter, so
+                # one reaching here means the retry budget is exhausted
                 self.logger.error(f"HTTP error {status_code} fetching URL {url}: {e}")
             return None
         except requests.exceptions.ConnectionError as e:
@@ -191,53 +590,77 @@ class DependencyScanner:
             self.logger.error(f"Unexpected error fetching URL {url}: {e}", exc_info=True)
             return None
     
-    def extract_text_from_html(self, html: str) -> str:
+    def extract_text_from_html(self, html: str, soup: Optional[BeautifulSoup] = None) -> str:
         """
         Extract text content from HTML, preserving code blocks
-        
+
         Args:
             html: HTML content
-            
+            soup: Optional pre-parsed BeautifulSoup tree to reuse
+
         Returns:
             Extracted text content
         """
         if not html or not isinstance(html, str):
             self.logger.warning("Invalid HTML content provided to extract_text_from_html")
             return ""
-        
+
+        if soup is None and LexborHTMLParser is not None:
+            try:
+                return self._extract_text_selectolax(html)
+            except Exception as e:
+                self.logger.debug(f"selectolax extraction failed, falling back to lxml: {e}")
+
+        if soup is None:
+            try:
+                return self._extract_text_lxml(html)
+            except (ParserError, ValueError) as e:
+                self.logger.debug(f"lxml extraction failed, falling back to BeautifulSoup: {e}")
+            except Exception as e:
+                self.logger.debug(f"Error in lxml text extraction: {e}")
+
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            if soup is None:
+                soup = BeautifulSoup(html, 'lxml')
             code_blocks = []
-            
+            # Dedup via a set - a list membership test compares every prior
+            # block's full text, which is quadratic on code-heavy pages
+            seen_blocks = set()
+
             try:
-                github_code = soup.find('div', class_=re.compile(r'blob-wrapper|highlight', re.I))
+                github_code = soup.find('div', class_=_GITHUB_CLASS_RE)
                 if github_code:
                     code_elem = github_code.find('code') or github_code.find('pre')
                     if code_elem:
-                        code_blocks.append(code_elem.get_text())
+                        github_text = code_elem.get_text()
+                        seen_blocks.add(github_text)
+                        code_blocks.append(github_text)
             except Exception as e:
                 self.logger.debug(f"Error extracting GitHub code blocks: {e}")
             
             try:
                 for code in soup.find_all(['code', 'pre', 'textarea']):
                     code_text = code.get_text()
-                    if code_text.strip() and code_text not in code_blocks:
+                    if code_text.strip() and code_text not in seen_blocks:
+                        seen_blocks.add(code_text)
                         code_blocks.append(code_text)
             except Exception as e:
                 self.logger.debug(f"Error extracting code blocks: {e}")
             
             try:
-                for div in soup.find_all('div', class_=re.compile(r'highlight|code|source|syntax|hljs', re.I)):
+                for div in soup.find_all('div', class_=_CODE_CLASS_RE):
                     div_text = div.get_text()
-                    if div_text.strip() and div_text not in code_blocks:
+                    if div_text.strip() and div_text not in seen_blocks:
+                        seen_blocks.add(div_text)
                         code_blocks.append(div_text)
             except Exception as e:
                 self.logger.debug(f"Error extracting div code blocks: {e}")
             
             try:
-                for pre in soup.find_all('pre', class_=re.compile(r'code|source', re.I)):
+                for pre in soup.find_all('pre', class_=_PRE_CLASS_RE):
                     pre_text = pre.get_text()
-                    if pre_text.strip() and pre_text not in code_blocks:
+                    if pre_text.strip() and pre_text not in seen_blocks:
+                        seen_blocks.add(pre_text)
                         code_blocks.append(pre_text)
             except Exception as e:
                 self.logger.debug(f"Error extracting pre code blocks: {e}")
@@ -250,7 +673,99 @@ class DependencyScanner:
         except Exception as e:
             self.logger.error(f"Error extracting text from HTML: {e}", exc_info=True)
             return html
-    
+
+    def _extract_text_lxml(self, html: str) -> str:
+        """
+        Extract text and code blocks with lxml's C-level text accumulation
+
+        text_content() collects the document text in a single C pass, and
+        one iter() walk gathers every code-like element - no Python-object
+        tree like BeautifulSoup builds, so long pages cost a fraction of
+        the memory and CPU.
+
+        Args:
+            html: HTML content
+
+        Returns:
+            Extracted text content
+        """
+        doc = lxml.html.fromstring(html)
+        code_blocks = []
+        seen_blocks = set()
+
+        # One walk over the tree, bucketing elements the same way the
+        # BeautifulSoup path sweeps for them
+        github_div = None
+        code_like = []
+        classed_divs = []
+        classed_pres = []
+        for elem in doc.iter('div', 'code', 'pre', 'textarea'):
+            if elem.tag == 'div':
+                cls = elem.get('class')
+                if cls:
+                    if github_div is None and _GITHUB_CLASS_RE.search(cls):
+                        github_div = elem
+                    if _CODE_CLASS_RE.search(cls):
+                        classed_divs.append(elem)
+            else:
+                code_like.append(elem)
+                if elem.tag == 'pre':
+                    cls = elem.get('class')
+                    if cls and _PRE_CLASS_RE.search(cls):
+                        classed_pres.append(elem)
+
+        if github_div is not None:
+            code_elem = next(github_div.iter('code'), None)
+            if code_elem is None:
+                code_elem = next(github_div.iter('pre'), None)
+            if code_elem is not None:
+                github_text = code_elem.text_content()
+                seen_blocks.add(github_text)
+                code_blocks.append(github_text)
+
+        for bucket in (code_like, classed_divs, classed_pres):
+            for elem in bucket:
+                elem_text = elem.text_content()
+                if elem_text.strip() and elem_text not in seen_blocks:
+                    seen_blocks.add(elem_text)
+                    code_blocks.append(elem_text)
+
+        text_content = doc.text_content()
+        combined = '\n'.join(code_blocks) + '\n' + text_content
+        self.logger.debug(f"Extracted {len(code_blocks)} code blocks, total text length: {len(combined)}")
+        return combined
+
+    def _extract_text_selectolax(self, html: str) -> str:
+        """
+        Extract text and code blocks using selectolax's Lexbor parser
+
+        Walks the document with one CSS selector pass instead of the four
+        separate BeautifulSoup sweeps - Lexbor parses and traverses in C,
+        which is far faster than the BS4 wrapper on large pages.
+
+        Args:
+            html: HTML content
+
+        Returns:
+            Extracted text content
+        """
+        tree = LexborHTMLParser(html)
+        code_blocks = []
+        seen_texts = set()
+
+        selector = ('code, pre, textarea, div.highlight, div.code, div.source, '
+                    'div.syntax, div.hljs, pre.code, pre.source, div.blob-wrapper code')
+        for node in tree.css(selector):
+            node_text = node.text(deep=True)
+            if node_text.strip() and node_text not in seen_texts:
+                seen_texts.add(node_text)
+                code_blocks.append(node_text)
+
+        text_content = tree.text(deep=True)
+        combined = '\n'.join(code_blocks) + '\n' + text_content
+        self.logger.debug(f"Extracted {len(code_blocks)} code blocks, total text length: {len(combined)}")
+        return combined
+
     def extract_dependencies(self, content: str, url: str = "") -> List[Dict]:
         """
         Extract dependencies from page content using regex patterns
@@ -268,19 +783,72 @@ class DependencyScanner:
         
         dependencies = []
         seen = set()
-        
+        # Checked once so per-match debug formatting is skipped entirely
+        # at the default INFO level
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        # One pass over the lowercased content tells us which literal
+        # anchors are present, so anchored patterns whose keyword never
+        # occurs can be skipped without scanning the document
+        content_lower = content.lower()
+        if self._anchor_automaton is not None:
+            found_anchors = {anchor for _, anchor in self._anchor_automaton.iter(content_lower)}
+        else:
+            found_anchors = {a for a in self._all_anchors if a in content_lower}
+
+        # re releases the GIL while matching, so on large inputs the
+        # pattern scans parallelize across cores; below the threshold the
+        # thread startup cost outweighs the win and matching stays lazy
+        prefetched = {}
+        if len(content) > 64 * 1024:
+            jobs = []
+            for dep_type, patterns in self.patterns.items():
+                anchors = self._anchors.get(dep_type, [])
+                for pattern_index, pattern in enumerate(patterns):
+                    anchor = anchors[pattern_index] if pattern_index < len(anchors) else None
+                    if anchor is not None and anchor not in found_anchors:
+                        continue
+                    if isinstance(pattern, str):
+                        continue
+                    jobs.append((dep_type, pattern_index, pattern))
+            if len(jobs) > 1:
+                try:
+                    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                        for dep_type, pattern_index, matches in executor.map(
+                                lambda job: (job[0], job[1], list(job[2].finditer(content))), jobs):
+                            prefetched[(dep_type, pattern_index)] = matches
+                except Exception as e:
+                    self.logger.warning(f"Parallel pattern scan failed, falling back to sequential: {e}")
+                    prefetched = {}
+
         try:
             for dep_type, patterns in self.patterns.items():
                 if not patterns:
                     continue
-                    
-                for pattern in patterns:
-                    try:
-                        matches = re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-                    except re.error as e:
-                        self.logger.error(f"Invalid regex pattern for {dep_type}: {pattern}. Error: {e}")
+
+                anchors = self._anchors.get(dep_type, [])
+                for pattern_index, pattern in enumerate(patterns):
+                    anchor = anchors[pattern_index] if pattern_index < len(anchors) else None
+                    if anchor is not None and anchor not in found_anchors:
                         continue
-                    
+                    if isinstance(pattern, str):
+                        # Patterns injected at runtime arrive as raw strings -
+                        # compile them here with the usual flags
+                        try:
+                            pattern = re.compile(pattern, re.MULTILINE | re.IGNORECASE | re.DOTALL)
+                        except re.error as e:
+                            self.logger.error(f"Invalid regex pattern for {dep_type}: {pattern}. Error: {e}")
+                            continue
+                    matches = prefetched.pop((dep_type, pattern_index), None)
+                    if matches is None:
+                        matches = pattern.finditer(content)
+
+                    # The stdlib engine backtracks and cannot be interrupted
+                    # mid-scan, so pathological pattern/content pairs are at
+                    # least surfaced loudly instead of silently eating the
+                    # scan budget (RE2, when installed, is linear-time)
+                    pattern_started = time.perf_counter()
+
                     for match in matches:
                         try:
                             groups = match.groups()
@@ -289,32 +857,37 @@ class DependencyScanner:
                                 if len(groups) >= 2:
                                     if len(groups) == 1 and '{' in match.group(0):
                                         deps_block = groups[0]
-                                        nested_matches = re.finditer(
-                                            r'["\']([a-zA-Z0-9@/_-]+)["\']\s*:\s*["\']([^"\']+)["\']',
-                                            deps_block
-                                        )
+                                        nested_matches = _NESTED_NPM_RE.finditer(deps_block)
                                         for nested_match in nested_matches:
                                             name = nested_match.group(1).strip()
                                             version = nested_match.group(2).strip()
-                                            if name and version and (name, version, dep_type) not in seen:
-                                                seen.add((name, version, dep_type))
-                                                dependencies.append({
-                                                    'name': name,
-                                                    'version': version,
-                                                    'type': dep_type,
-                                                    'line': nested_match.group(0)
-                                                })
+                                            if name and version:
+                                                key = f"{name}\x00{version}\x00{dep_type}"
+                                                if key not in seen:
+                                                    seen.add(key)
+                                                    dependencies.append(Dependency(
+                                                        name, version, dep_type, nested_match.group(0)))
                                     else:
                                         name = groups[0].strip() if groups[0] else ""
                                         version = groups[1].strip() if len(groups) > 1 and groups[1] else ""
-                                        if name and version and (name, version, dep_type) not in seen:
-                                            seen.add((name, version, dep_type))
-                                            dependencies.append({
-                                                'name': name,
-                                                'version': version,
-                                                'type': dep_type,
-                                                'line': match.group(0)
-                                            })
+                                        if name and version:
+                                            key = f"{name}\x00{version}\x00{dep_type}"
+                                            if key not in seen:
+                                                seen.add(key)
+                                                dependencies.append(Dependency(
+                                                    name, version, dep_type, match.group(0)))
+                                        # The removed caret-stripping pattern
+                                        # also emitted the bare numeric version
+                                        # for ^/~ ranges - keep that output
+                                        # from the single pass
+                                        if (name and version[:1] in ('^', '~')
+                                                and version[1:2] in _VERSION_START_CHARS):
+                                            stripped = version[1:]
+                                            key = f"{name}\x00{stripped}\x00{dep_type}"
+                                            if key not in seen:
+                                                seen.add(key)
+                                                dependencies.append(Dependency(
+                                                    name, stripped, dep_type, match.group(0)))
                             
                             elif dep_type == 'pip':
                                 match_text = match.group(0)
@@ -327,62 +900,41 @@ class DependencyScanner:
                                 else:
                                     command_type = 'pip'
                                 
+                                # Walk continuation lines with bounded
+                                # find() calls - slicing content[match_start:]
+                                # copies the whole document tail per match
                                 full_command = match_text
                                 match_start = match.start()
-                                remaining_content = content[match_start:]
-                                lines = remaining_content.split('\n')
-                                if len(lines) > 1:
-                                    first_line = lines[0].rstrip()
+                                line_end = content.find('\n', match_start)
+                                if line_end != -1:
+                                    first_line = content[match_start:line_end].rstrip()
                                     if first_line.endswith('\\'):
                                         full_command = first_line[:-1].strip()
-                                        for line in lines[1:10]:
-                                            line = line.strip()
+                                        pos = line_end + 1
+                                        for _ in range(9):
+                                            next_end = content.find('\n', pos)
+                                            if next_end == -1:
+                                                next_end = len(content)
+                                            line = content[pos:next_end].strip()
                                             if not line:
                                                 break
                                             if line.endswith('\\'):
                                                 full_command += ' ' + line[:-1].strip()
+                                                pos = next_end + 1
                                             else:
                                                 full_command += ' ' + line
                                                 break
                                 
                                 packages = self.extract_packages_from_command(full_command, command_type)
                                 
-                                invalid_names = {
-                                    'CFLAGS', 'CXXFLAGS', 'LDFLAGS', 'CC', 'CXX', 'export', 'echo', 
-                                    'sudo', 'apt-get', 'yum', 'pkg', 'brew', 'conda', 'pip', 'python',
-                                    'python3', 'pip3', 'make', 'git', 'cd', 'source', 'activate', 'install',
-                                    'build', 'test', 'run', 'check', 'version', 'name', 'wheel',
-                                    'http', 'https', 'ftp', 'git', 'ssh',
-                                    'checkout', 'platform', 'command', 'once', 'environment', 'env',
-                                    'sklearn-env', 'sklearn-dev', 'Please', 'refer', 'Developer', 'Guide',
-                                    'Useful', 'pytest', 'Note', 'Building', 'Installing',
-                                    'editable', 'verbose', 'config', 'settings', 'no-build', 'isolation',
-                                    'extra-index', 'pre', 'simple', 'scikit-learn', 'n', 'c', 'for',
-                                    'with', 'from', 'the', 'and', 'or', 'to', 'a', 'an', 'is', 'are',
-                                    'pypi', 'anaconda', 'org', 'scientific', 'nightly', 'wheels',
-                                    'index', 'registry', 'channel', 'forge', 'meta', 'package',
-                                    'conda-forge', 'It', 'python'
-                                }
-                                
                                 for package in packages:
                                     name = package.strip()
-                                    if (name and 
-                                        name.lower() not in [n.lower() for n in invalid_names] and
-                                        len(name) >= 2 and len(name) < 50 and
-                                        re.match(r'^[a-zA-Z0-9_-]+$', name) and
-                                        not name.startswith('$') and
-                                        not name.startswith('-') and
-                                        not name.startswith('http') and
-                                        not name.startswith('/') and
-                                        not name.startswith('.') and
-                                        (name, '', dep_type) not in seen):
-                                        seen.add((name, '', dep_type))
-                                        dependencies.append({
-                                            'name': name,
-                                            'version': '',
-                                            'type': dep_type,
-                                            'line': full_command[:200]
-                                        })
+                                    if name and _is_valid_pip_name(name):
+                                        key = f"{name}\x00\x00{dep_type}"
+                                        if key not in seen:
+                                            seen.add(key)
+                                            dependencies.append(Dependency(
+                                                name, '', dep_type, full_command[:200]))
                             
                             elif dep_type == 'maven':
                                 if len(groups) >= 3:
@@ -390,14 +942,12 @@ class DependencyScanner:
                                     artifact_id = groups[1].strip()
                                     version = groups[2].strip()
                                     name = f"{group_id}:{artifact_id}"
-                                    if name and version and (name, version, dep_type) not in seen:
-                                        seen.add((name, version, dep_type))
-                                        dependencies.append({
-                                            'name': name,
-                                            'version': version,
-                                            'type': dep_type,
-                                            'line': match.group(0)
-                                        })
+                                    if name and version:
+                                        key = f"{name}\x00{version}\x00{dep_type}"
+                                        if key not in seen:
+                                            seen.add(key)
+                                            dependencies.append(Dependency(
+                                                name, version, dep_type, match.group(0)))
                             
                             elif dep_type == 'gradle':
                                 if len(groups) >= 3:
@@ -410,84 +960,66 @@ class DependencyScanner:
                                         artifact_id = groups[1].strip()
                                         version = groups[2].strip()
                                     name = f"{group_id}:{artifact_id}"
-                                    if name and version and (name, version, dep_type) not in seen:
-                                        seen.add((name, version, dep_type))
-                                        dependencies.append({
-                                            'name': name,
-                                            'version': version,
-                                            'type': dep_type,
-                                            'line': match.group(0)
-                                        })
+                                    if name and version:
+                                        key = f"{name}\x00{version}\x00{dep_type}"
+                                        if key not in seen:
+                                            seen.add(key)
+                                            dependencies.append(Dependency(
+                                                name, version, dep_type, match.group(0)))
                             
                             elif dep_type == 'go':
                                 if len(groups) >= 2:
                                     name = groups[0].strip() if groups[0] else ""
                                     version = groups[1].strip() if groups[1] else ""
-                                    if name and version and (name, version, dep_type) not in seen:
-                                        seen.add((name, version, dep_type))
-                                        dependencies.append({
-                                            'name': name,
-                                            'version': version,
-                                            'type': dep_type,
-                                            'line': match.group(0)
-                                        })
+                                    if name and version:
+                                        key = f"{name}\x00{version}\x00{dep_type}"
+                                        if key not in seen:
+                                            seen.add(key)
+                                            dependencies.append(Dependency(
+                                                name, version, dep_type, match.group(0)))
                             
                             elif dep_type in ['ruby', 'composer']:
                                 if len(groups) >= 2:
                                     name = groups[0].strip() if groups[0] else ""
                                     version = groups[1].strip() if groups[1] else ""
-                                    if name and version and (name, version, dep_type) not in seen:
-                                        seen.add((name, version, dep_type))
-                                        dependencies.append({
-                                            'name': name,
-                                            'version': version,
-                                            'type': dep_type,
-                                            'line': match.group(0)
-                                        })
+                                    if name and version:
+                                        key = f"{name}\x00{version}\x00{dep_type}"
+                                        if key not in seen:
+                                            seen.add(key)
+                                            dependencies.append(Dependency(
+                                                name, version, dep_type, match.group(0)))
                             
                             elif dep_type == 'generic':
                                 if len(groups) >= 2:
                                     name = groups[0].strip() if groups[0] else ""
                                     version = groups[1].strip() if groups[1] else ""
                                     
-                                    invalid_names = {'CFLAGS', 'CXXFLAGS', 'LDFLAGS', 'export', 'echo', 'sudo', 
-                                                   'apt-get', 'yum', 'pkg', 'brew', 'conda', 'pip', 'python',
-                                                   'python3', 'pip3', 'make', 'git', 'cd', 'source', 'activate',
-                                                   'install', 'build', 'test', 'run', 'check', 'version', 'name',
-                                                   'wheel', 'CC', 'CXX', 'PATH', 'HOME', 'USER', 'SKLEARN',
-                                                   'Please', 'refer', 'Developer', 'Guide', 'Useful', 'pytest'}
-                                    
                                     line_text = match.group(0)
-                                    if (name and version and 
-                                        len(name) > 2 and len(name) < 50 and
-                                        len(version) < 50 and
-                                        len(line_text) < 500 and
-                                        name not in invalid_names and
-                                        not name.startswith('$') and
-                                        not version.startswith('$') and
-                                        not name.startswith('http') and
-                                        not name.startswith('/') and
-                                        not '\n' in name and
-                                        not '\n' in version and
-                                        re.match(r'^[a-zA-Z0-9_-]+$', name) and
-                                        re.match(r'[\d.]+', version) and
-                                        (name, version, dep_type) not in seen):
-                                        seen.add((name, version, dep_type))
-                                        dependencies.append({
-                                            'name': name,
-                                            'version': version,
-                                            'type': dep_type,
-                                            'line': match.group(0)[:200]
-                                        })
+                                    if (name and version and
+                                            _is_valid_generic_candidate(name, version, line_text)):
+                                        key = f"{name}\x00{version}\x00{dep_type}"
+                                        if key not in seen:
+                                            seen.add(key)
+                                            dependencies.append(Dependency(
+                                                name, version, dep_type, match.group(0)[:200]))
                         except Exception as e:
-                            self.logger.debug(f"Error processing match for {dep_type} pattern: {e}")
+                            if debug_enabled:
+                                self.logger.debug(f"Error processing match for {dep_type} pattern: {e}")
                             continue
-                        
+
+                    elapsed = time.perf_counter() - pattern_started
+                    if elapsed > 0.5:
+                        self.logger.warning(
+                            f"Pattern {pattern_index} for {dep_type} took {elapsed:.2f}s "
+                            f"on {len(content)} characters")
+
         except Exception as e:
             self.logger.error(f"Error in extract_dependencies: {e}", exc_info=True)
         
         self.logger.info(f"Extracted {len(dependencies)} dependencies from content (URL: {url})")
-        return dependencies
+        # Convert to plain dicts once at the public boundary - callers
+        # serialize to JSON/CSV and expect dictionaries
+        return [dep._asdict() for dep in dependencies]
     
     def extract_packages_from_command(self, command_text: str, command_type: str = 'pip') -> List[str]:
         """
@@ -529,15 +1061,15 @@ class DependencyScanner:
                     if i > 0 and parts[i-1] in ['-n', '--name']:
                         continue
                     
-                    if part.startswith('-'):
+                    if part[0] == '-':
                         continue
-                    
+
                     if '://' in part or part.startswith('http'):
                         continue
-                    
-                    if part and re.match(r'^[a-zA-Z0-9_-]+$', part):
+
+                    if part and not (set(part) - _ALLOWED_NAME_CHARS):
                         packages.append(part)
-            
+
             elif command_type == 'pip':
                 parts = command_text.split()
                 skip_next = False
@@ -547,21 +1079,20 @@ class DependencyScanner:
                         skip_next = False
                         continue
                     
-                    if part.startswith('--') or part.startswith('-'):
+                    # split() never yields empty parts, so part[0] is safe -
+                    # one char comparison covers both the -- and - prefixes
+                    if part[0] == '-':
                         if part in ['--index-url', '--extra-index-url', '--find-links', '-f']:
                             skip_next = True
                         continue
-                    
+
                     if part in ['pip', 'install', 'uninstall', 'upgrade']:
                         continue
-                    
+
                     if '://' in part or part.startswith('http'):
                         continue
-                    
-                    if part.startswith('-'):
-                        continue
-                    
-                    if part and re.match(r'^[a-zA-Z0-9_-]+$', part):
+
+                    if part and not (set(part) - _ALLOWED_NAME_CHARS):
                         packages.append(part)
             else:
                 self.logger.warning(f"Unknown command_type: {command_type}")
@@ -585,61 +1116,113 @@ class DependencyScanner:
         if not json_content or not isinstance(json_content, str):
             self.logger.warning("Invalid JSON content provided")
             return []
-        
+
+        # Multi-MB lockfiles are streamed key/value pair by pair so memory
+        # stays bounded; small files keep the lower-overhead loads path
+        if ijson is not None and len(json_content) > _STREAM_JSON_THRESHOLD:
+            return self._stream_json_dependencies(json_content, url)
+
+        try:
+            data = _json_loads(json_content)
+        except ValueError as e:
+            self.logger.debug(f"JSON decode error: {e}")
+            return []
+
+        return self._extract_from_json_obj(data, url)
+
+    def _stream_json_dependencies(self, json_content: str, url: str = "") -> List[Dict]:
+        """
+        Extract dependencies from large JSON content without decoding it whole
+
+        ijson yields the name/version pairs under each dependency section
+        directly from the byte stream, so a 50 MB package-lock.json never
+        exists in memory as a dict.
+
+        Args:
+            json_content: JSON string content (over the streaming threshold)
+            url: Source URL
+
+        Returns:
+            List of dependency dictionaries
+        """
         dependencies = []
-        
+        encoded = json_content.encode('utf-8')
+
+        for section_keys, dep_type in _MANIFEST_SECTIONS:
+            for section_key in section_keys:
+                self._emit_section(
+                    dependencies,
+                    ijson.kvitems(io.BytesIO(encoded), section_key),
+                    dep_type, section_key)
+
+        return dependencies
+
+    def _extract_from_json_obj(self, data, url: str = "") -> List[Dict]:
+        """
+        Extract dependencies from an already-decoded JSON object
+
+        Args:
+            data: Decoded JSON data (any type; non-dicts yield no results)
+            url: Source URL
+
+        Returns:
+            List of dependency dictionaries
+        """
+        dependencies = []
+
         try:
-            data = json.loads(json_content)
-            
             if isinstance(data, dict):
-                for dep_type_key in ['dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies', 'overrides']:
-                    if dep_type_key in data and isinstance(data[dep_type_key], dict):
-                        try:
-                            for name, version in data[dep_type_key].items():
-                                if name and version:
-                                    dependencies.append({
-                                        'name': str(name),
-                                        'version': str(version),
-                                        'type': 'npm',
-                                        'line': f'"{name}": "{version}"'
-                                    })
-                        except Exception as e:
-                            self.logger.warning(f"Error parsing {dep_type_key}: {e}")
-                
-                if 'require' in data and isinstance(data['require'], dict):
-                    try:
-                        for name, version in data['require'].items():
-                            if name and version:
-                                dependencies.append({
-                                    'name': str(name),
-                                    'version': str(version),
-                                    'type': 'composer',
-                                    'line': f'"{name}": "{version}"'
-                                })
-                    except Exception as e:
-                        self.logger.warning(f"Error parsing require: {e}")
-                
-                if 'require-dev' in data and isinstance(data['require-dev'], dict):
-                    try:
-                        for name, version in data['require-dev'].items():
-                            if name and version:
-                                dependencies.append({
-                                    'name': str(name),
-                                    'version': str(version),
-                                    'type': 'composer',
-                                    'line': f'"{name}": "{version}"'
-                                })
-                    except Exception as e:
-                        self.logger.warning(f"Error parsing require-dev: {e}")
+                # One membership probe per ecosystem decides which section
+                # loop runs - a composer.json never executes the five npm
+                # branches, and a package.json skips the composer ones
+                for section_keys, dep_type in _MANIFEST_SECTIONS:
+                    if not any(key in data for key in section_keys):
+                        continue
+                    for section_key in section_keys:
+                        section = data.get(section_key)
+                        if isinstance(section, dict):
+                            self._emit_section(dependencies, section.items(),
+                                               dep_type, section_key)
             else:
                 self.logger.debug("JSON data is not a dictionary")
-        
-        except json.JSONDecodeError as e:
-            self.logger.debug(f"JSON decode error: {e}")
+
         except Exception as e:
             self.logger.error(f"Error parsing JSON dependencies: {e}", exc_info=True)
-        
+
         return dependencies
+
+    def _emit_section(self, dependencies: List[Dict], items,
+                      dep_type: str, section_key: str) -> None:
+        """
+        Append one manifest section's name/version pairs to dependencies
+
+        Args:
+            dependencies: Output list to append to
+            items: Iterable of (package name, version) pairs
+            dep_type: Dependency type label for the emitted entries
+            section_key: Manifest key the section came from (for logging)
+        """
+        # JSON keys are always str and versions nearly always are, so the
+        # str() coercion is skipped in the common case; the append method
+        # is bound once per section rather than looked up on every entry
+        append = dependencies.append
+        try:
+            for name, version in items:
+                if name and version:
+                    if not isinstance(name, str):
+                        name = str(name)
+                    if not isinstance(version, str):
+                        version = str(version)
+                    append({
+                        'name': name,
+                        'version': version,
+                        'type': dep_type,
+                        # Plain concatenation of the already-validated
+                        # strings beats f-string formatting in this hot loop
+                        'line': '"' + name + '": "' + version + '"'
+                    })
+        except Exception as e:
+            self.logger.warning(f"Error parsing {section_key}: {e}")
     
     def scan(self, url: str) -> Dict:
         """
@@ -661,102 +1244,172 @@ class DependencyScanner:
             }
         
         self.logger.info(f"Starting scan for URL: {url}")
-        
+
+        content = self.fetch_page(url)
+        if not content:
+            self.logger.error(f"Failed to fetch content from URL: {url}")
+            return {
+                'url': url,
+                'error': 'Failed to fetch page',
+                'dependencies': [],
+                'summary': {'total': 0, 'by_type': {}}
+            }
+
+        return self._process_content(content, url, content_type=self._last_content_type)
+
+    async def ascan(self, client, url: str) -> Dict:
+        """
+        Asynchronously scan a URL for dependencies using an httpx.AsyncClient
+
+        Args:
+            client: httpx.AsyncClient instance shared by the caller
+            url: URL to scan
+
+        Returns:
+            Dictionary with scan results in JSON format
+        """
+        if not url or not isinstance(url, str):
+            self.logger.error("Invalid URL provided to ascan method")
+            return {
+                'url': str(url) if url else '',
+                'error': 'Invalid URL provided',
+                'dependencies': [],
+                'summary': {'total': 0, 'by_type': {}}
+            }
+
+        self.logger.info(f"Starting async scan for URL: {url}")
+
+        gh_match = _GH_BLOB_RE.match(url)
+        if gh_match:
+            fetch_url = f'https://raw.githubusercontent.com/{gh_match.group(1)}/{gh_match.group(2)}'
+            self.logger.info(f"Converting GitHub blob URL to raw URL: {fetch_url}")
+        else:
+            fetch_url = url
+
+        content_type = None
+        try:
+            response = await client.get(fetch_url, timeout=self.timeout, follow_redirects=True)
+            response.raise_for_status()
+            content = response.text
+            content_type = response.headers.get('Content-Type', '').lower()
+        except Exception as e:
+            self.logger.error(f"Error fetching URL {fetch_url}: {e}")
+            return {
+                'url': url,
+                'error': 'Failed to fetch page',
+                'dependencies': [],
+                'summary': {'total': 0, 'by_type': {}}
+            }
+
+        if not content:
+            self.logger.error(f"Failed to fetch content from URL: {url}")
+            return {
+                'url': url,
+                'error': 'Failed to fetch page',
+                'dependencies': [],
+                'summary': {'total': 0, 'by_type': {}}
+            }
+
+        return self._process_content(content, url, content_type=content_type)
+
+    async def scan_many(self, urls: List[str], max_concurrency: int = 50) -> List[Dict]:
+        """
+        Scan many URLs concurrently on one shared httpx.AsyncClient
+
+        Args:
+            urls: URLs to scan
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of scan result dictionaries, in the same order as urls
+        """
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scan_one(client, url):
+            async with semaphore:
+                return await self.ascan(client, url)
+
+        async with httpx.AsyncClient(limits=limits) as client:
+            return list(await asyncio.gather(*[scan_one(client, url) for url in urls]))
+
+    def scan_all(self, urls: List[str]) -> List[Dict]:
+        """
+        Scan many URLs, concurrently when httpx is available
+
+        Args:
+            urls: URLs to scan
+
+        Returns:
+            List of scan result dictionaries, in the same order as urls
+        """
+        if httpx is not None:
+            try:
+                return asyncio.run(self.scan_many(urls))
+            except RuntimeError as e:
+                # Already inside an event loop - callers there should await
+                # scan_many directly; fall back to sequential scanning
+                self.logger.warning(f"Cannot start event loop, scanning sequentially: {e}")
+        return [self.scan(url) for url in urls]
+
+    def _process_content(self, content: str, url: str, content_type: Optional[str] = None) -> Dict:
+        """
+        Extract dependencies from fetched content and build the results dict
+
+        Args:
+            content: Fetched page content
+            url: Source URL
+            content_type: Optional Content-Type header of the response
+
+        Returns:
+            Dictionary with scan results in JSON format
+        """
         try:
-            content = self.fetch_page(url)
-            if not content:
-                self.logger.error(f"Failed to fetch content from URL: {url}")
-                return {
-                    'url': url,
-                    'error': 'Failed to fetch page',
-                    'dependencies': [],
-                    'summary': {'total': 0, 'by_type': {}}
-                }
-            
             self.logger.info(f"Content fetched successfully, length: {len(content)} characters")
             dependencies = []
-            
-            try:
-                json.loads(content)
-                self.logger.info("Detected raw JSON content")
+
+            cache_key = hashlib.sha256(content.encode('utf-8', 'replace')).digest()
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Reusing cached parse result for unchanged content (URL: {url})")
+                return self._build_results(url, [dict(dep) for dep in cached])
+
+            if content_type and 'json' in content_type:
+                # The server already declared JSON - parse it directly and
+                # skip the HTML tree build and the regex pattern sweep
+                self.logger.info("Content type declares JSON, parsing directly")
                 dependencies = self.parse_json_dependencies(content, url)
                 self.logger.info(f"Found {len(dependencies)} dependencies from JSON parsing")
-            except (json.JSONDecodeError, ValueError):
+                self._cache_parse(cache_key, dependencies)
+                return self._build_results(url, dependencies)
+
+            data = _try_parse_json(content)
+            if data is not None:
+                self.logger.info("Detected raw JSON content")
+                dependencies = self._extract_from_json_obj(data, url)
+                self.logger.info(f"Found {len(dependencies)} dependencies from JSON parsing")
+            else:
                 self.logger.info("Content is not raw JSON, parsing as HTML")
                 try:
-                    text_content = self.extract_text_from_html(content)
-                    soup = BeautifulSoup(content, 'lxml')
-                    
-                    github_code_containers = [
-                        soup.find('div', class_=re.compile(r'blob-wrapper', re.I)),
-                        soup.find('table', class_=re.compile(r'highlight', re.I)),
-                        soup.find('div', {'data-tagsearch-path': True}),
-                    ]
-                    
-                    for container in github_code_containers:
-                        if container:
-                            try:
-                                code_elem = container.find('code') or container.find('pre')
-                                if code_elem:
-                                    code_text = code_elem.get_text().strip()
-                                    if code_text and len(code_text) > 20:
-                                        try:
-                                            json.loads(code_text)
-                                            json_deps = self.parse_json_dependencies(code_text, url)
-                                            if json_deps:
-                                                dependencies.extend(json_deps)
-                                                self.logger.info(f"Found {len(json_deps)} dependencies from GitHub code container")
-                                                break
-                                        except (json.JSONDecodeError, ValueError):
-                                            pass
-                            except Exception as e:
-                                self.logger.debug(f"Error processing GitHub container: {e}")
-                                continue
-                    
-                    if not dependencies:
-                        try:
-                            code_blocks = soup.find_all(['pre', 'code'])
-                            for code_block in code_blocks:
-                                try:
-                                    code_text = code_block.get_text().strip()
-                                    if not code_text or len(code_text) < 20:
-                                        continue
-                                    json.loads(code_text)
-                                    json_deps = self.parse_json_dependencies(code_text, url)
-                                    if json_deps:
-                                        dependencies.extend(json_deps)
-                                        self.logger.info(f"Found {len(json_deps)} dependencies from code block")
-                                        break
-                                except (json.JSONDecodeError, ValueError):
-                                    continue
-                                except Exception as e:
-                                    self.logger.debug(f"Error processing code block: {e}")
-                                    continue
-                        except Exception as e:
-                            self.logger.warning(f"Error processing code blocks: {e}")
-                    
-                    if not dependencies:
-                        try:
-                            json_scripts = soup.find_all('script', type=re.compile(r'application/json', re.I))
-                            for script in json_scripts:
-                                try:
-                                    if script.string:
-                                        json.loads(script.string)
-                                        json_deps = self.parse_json_dependencies(script.string, url)
-                                        if json_deps:
-                                            dependencies.extend(json_deps)
-                                            self.logger.info(f"Found {len(json_deps)} dependencies from script tag")
-                                            break
-                                except (json.JSONDecodeError, ValueError, AttributeError):
-                                    continue
-                                except Exception as e:
-                                    self.logger.debug(f"Error processing script tag: {e}")
-                                    continue
-                        except Exception as e:
-                            self.logger.warning(f"Error processing script tags: {e}")
-                    
+                    # lxml parses and walks the tree entirely in C; the
+                    # BeautifulSoup helpers stay as the fallback for markup
+                    # lxml refuses outright
+                    tree = None
+                    try:
+                        tree = lxml.html.fromstring(content)
+                    except (ParserError, ValueError) as e:
+                        self.logger.debug(f"lxml parse failed, falling back to BeautifulSoup: {e}")
+
+                    soup = None
+                    if tree is not None:
+                        dependencies = self._json_probes_lxml(tree, url)
+                    else:
+                        soup = BeautifulSoup(content, 'lxml')
+                        dependencies = self._json_from_soup(soup, url)
+
                     if not dependencies:
                         self.logger.info("No JSON found in HTML, trying regex patterns")
+                        text_content = self.extract_text_from_html(content, soup=soup)
                         regex_deps = self.extract_dependencies(text_content, url)
                         dependencies.extend(regex_deps)
                         self.logger.info(f"Found {len(regex_deps)} dependencies from regex patterns")
@@ -770,28 +1423,11 @@ class DependencyScanner:
                         'summary': {'total': 0, 'by_type': {}}
                     }
             
-            summary = {
-                'total': len(dependencies),
-                'by_type': {}
-            }
-            
-            for dep in dependencies:
-                try:
-                    dep_type = dep.get('type', 'unknown')
-                    summary['by_type'][dep_type] = summary['by_type'].get(dep_type, 0) + 1
-                except Exception as e:
-                    self.logger.debug(f"Error processing dependency for summary: {e}")
-                    continue
-            
-            self.logger.info(f"Scan completed. Total dependencies found: {summary['total']}")
-            return {
-                'url': url,
-                'dependencies': dependencies,
-                'summary': summary
-            }
-            
+            self._cache_parse(cache_key, dependencies)
+            return self._build_results(url, dependencies)
+
         except Exception as e:
-            self.logger.error(f"Unexpected error in scan method: {e}", exc_info=True)
+            self.logger.error(f"Unexpected error processing content: {e}", exc_info=True)
             return {
                 'url': url,
                 'error': f'Unexpected error: {str(e)}',
@@ -799,6 +1435,186 @@ class DependencyScanner:
                 'summary': {'total': 0, 'by_type': {}}
             }
 
+    def _json_probes_lxml(self, tree, url: str) -> List[Dict]:
+        """
+        Run the JSON probes against a raw lxml tree
+
+        Mirrors the old BeautifulSoup probe helpers but traverses with
+        XPath, which walks the document in C instead of Python-level
+        node wrappers. The stages run sequentially on purpose: they share
+        one lxml tree, which is not safe to traverse from multiple
+        threads, and each XPath stage is a fraction of the parse cost
+        that fanning out would try to hide.
+
+        Args:
+            tree: Parsed lxml.html tree
+            url: Source URL
+
+        Returns:
+            List of dependency dictionaries (empty if none found)
+        """
+        containers = []
+        for xpath in ("//div[contains(@class,'blob-wrapper')]",
+                      "//table[contains(@class,'highlight')]",
+                      "//div[@data-tagsearch-path]"):
+            found = tree.xpath(xpath)
+            if found:
+                containers.append(found[0])
+
+        for container in containers:
+            try:
+                code_elems = container.xpath('.//code') or container.xpath('.//pre')
+                if code_elems:
+                    code_text = code_elems[0].text_content().strip()
+                    if code_text and len(code_text) > 20:
+                        data = _try_parse_json(code_text)
+                        if data is not None:
+                            json_deps = self._extract_from_json_obj(data, url)
+                            if json_deps:
+                                self.logger.info(f"Found {len(json_deps)} dependencies from GitHub code container")
+                                return json_deps
+            except Exception as e:
+                self.logger.debug(f"Error processing GitHub container: {e}")
+                continue
+
+        for code_block in tree.xpath('//pre | //code'):
+            try:
+                code_text = code_block.text_content().strip()
+                if not code_text or len(code_text) < 20:
+                    continue
+                data = _try_parse_json(code_text)
+                if data is None:
+                    continue
+                json_deps = self._extract_from_json_obj(data, url)
+                if json_deps:
+                    self.logger.info(f"Found {len(json_deps)} dependencies from code block")
+                    return json_deps
+            except Exception as e:
+                self.logger.debug(f"Error processing code block: {e}")
+                continue
+
+        for script in tree.xpath("//script[contains(translate(@type,'JSON','json'),'json')]"):
+            try:
+                if script.text:
+                    data = _try_parse_json(script.text)
+                    if data is None:
+                        continue
+                    json_deps = self._extract_from_json_obj(data, url)
+                    if json_deps:
+                        self.logger.info(f"Found {len(json_deps)} dependencies from script tag")
+                        return json_deps
+            except Exception as e:
+                self.logger.debug(f"Error processing script tag: {e}")
+                continue
+
+        return []
+
+    def _iter_candidates(self, soup: BeautifulSoup):
+        """
+        Yield candidate JSON strings from a single walk of the parsed tree
+
+        One descendants pass replaces the separate GitHub-container,
+        pre/code and script-tag sweeps - the containers' JSON always lives
+        in a nested code or pre element, so yielding those plus JSON-typed
+        scripts covers every case the three sweeps did.
+
+        Args:
+            soup: Parsed HTML tree
+
+        Yields:
+            Tuples of (source label, candidate text)
+        """
+        for node in soup.descendants:
+            name = getattr(node, 'name', None)
+            if name in ('pre', 'code'):
+                text = node.get_text().strip()
+                if text and len(text) >= 20:
+                    yield 'code block', text
+            elif name == 'script':
+                script_type = node.get('type') or ''
+                if 'json' in script_type.lower() and node.string:
+                    yield 'script tag', node.string
+
+    def _json_from_soup(self, soup: BeautifulSoup, url: str) -> List[Dict]:
+        """
+        Extract JSON dependencies from a BeautifulSoup tree in one pass
+
+        Args:
+            soup: Parsed HTML tree
+            url: Source URL
+
+        Returns:
+            List of dependency dictionaries (empty if none found)
+        """
+        try:
+            for source, candidate in self._iter_candidates(soup):
+                try:
+                    data = _try_parse_json(candidate)
+                    if data is None:
+                        continue
+                    json_deps = self._extract_from_json_obj(data, url)
+                    if json_deps:
+                        self.logger.info(f"Found {len(json_deps)} dependencies from {source}")
+                        return json_deps
+                except Exception as e:
+                    self.logger.debug(f"Error processing {source}: {e}")
+                    continue
+        except Exception as e:
+            self.logger.warning(f"Error processing candidate blocks: {e}")
+        return []
+
+    def _cache_parse(self, cache_key: bytes, dependencies: List[Dict]):
+        """
+        Remember the parsed dependency list for a content hash
+
+        Args:
+            cache_key: SHA-256 digest of the page content
+            dependencies: Extracted dependency dictionaries
+        """
+        # Bounded so long-running batch scans cannot grow the cache forever
+        if len(self._parse_cache) >= 128:
+            self._parse_cache.clear()
+        self._parse_cache[cache_key] = [dict(dep) for dep in dependencies]
+
+    def _build_results(self, url: str, dependencies: List[Dict]) -> Dict:
+        """
+        Build the results dictionary with a per-type summary
+
+        Args:
+            url: Source URL
+            dependencies: Extracted dependency dictionaries
+
+        Returns:
+            Dictionary with scan results in JSON format
+        """
+        # Different extraction sources can report the same dependency -
+        # drop exact (name, version, type) repeats so the output and any
+        # CSV written from it stay minimal
+        seen = set()
+        deduped = []
+        for dep in dependencies:
+            try:
+                key = (dep['name'], dep['version'], dep['type'])
+            except (TypeError, KeyError):
+                deduped.append(dep)
+                continue
+            if key not in seen:
+                seen.add(key)
+                deduped.append(dep)
+
+        summary = {
+            'total': len(deduped),
+            'by_type': dict(Counter(
+                dep.get('type', 'unknown') for dep in deduped if isinstance(dep, dict)))
+        }
+
+        self.logger.info(f"Scan completed. Total dependencies found: {summary['total']}")
+        return {
+            'url': url,
+            'dependencies': deduped,
+            'summary': summary
+        }
+
 
 def save_to_csv(results: Dict, filename: str = None, logger: Optional[logging.Logger] = None):
     """
@@ -822,26 +1638,34 @@ def save_to_csv(results: Dict, filename: str = None, logger: Optional[logging.Lo
         return
     
     try:
+        source_url = results.get('url', '')
+        # Validate up front so the row generator below can never raise
+        # mid-write - malformed entries are dropped in one pass instead of
+        # paying for a try/except frame on every row
+        good = [dep for dep in dependencies if isinstance(dep, dict)]
+        if len(good) < len(dependencies):
+            logger.warning(f"Skipping {len(dependencies) - len(good)} malformed dependency entries")
+
+        def rows():
+            for dep in good:
+                line = dep.get('line', '')
+                if not isinstance(line, str):
+                    line = str(line)
+                yield (dep.get('name', ''),
+                       dep.get('version', ''),
+                       dep.get('type', ''),
+                       source_url,
+                       line.translate(_NL_TABLE)[:200])
+
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'version', 'type', 'source_url', 'line']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            
-            for dep in dependencies:
-                try:
-                    writer.writerow({
-                        'name': dep.get('name', ''),
-                        'version': dep.get('version', ''),
-                        'type': dep.get('type', ''),
-                        'source_url': results.get('url', ''),
-                        'line': dep.get('line', '').replace('\n', ' ').replace('\r', ' ')[:200]
-                    })
-                except Exception as e:
-                    logger.warning(f"Error writing dependency row: {e}")
-                    continue
-        
-        logger.info(f"Results saved to CSV file: {filename} (Total dependencies: {len(dependencies)})")
+            # csv.writer over plain tuples skips the per-row dict build and
+            # field mapping that DictWriter does; writerows drives the whole
+            # generator from C
+            writer = csv.writer(csvfile)
+            writer.writerow(['name', 'version', 'type', 'source_url', 'line'])
+            writer.writerows(rows())
+
+        logger.info(f"Results saved to CSV file: {filename} (Total dependencies: {len(good)})")
         
     except PermissionError:
         logger.error(f"Permission denied: Cannot write to CSV file {filename}")
@@ -857,19 +1681,25 @@ def main():
     
     try:
         csv_filename = None
-        
-        if len(sys.argv) >= 2:
-            url = sys.argv[1]
-            if len(sys.argv) >= 3:
-                csv_filename = sys.argv[2]
+
+        # --no-json suppresses the full JSON dump - for CSV-only runs on
+        # pages with thousands of dependencies that serialization is pure
+        # wasted string building
+        args = [arg for arg in sys.argv[1:] if arg != '--no-json']
+        no_json = len(args) != len(sys.argv) - 1
+
+        if args:
+            url = args[0]
+            if len(args) >= 2:
+                csv_filename = args[1]
         elif DEFAULT_URL:
             url = DEFAULT_URL
             logger.info(f"Using default URL from configuration: {url}")
         else:
             logger.error("No URL provided and no default URL set")
-            print("Usage: python scanner.py <url> [csv_filename]")
+            print("Usage: python scanner.py <url> [csv_filename] [--no-json]")
             print("Example: python scanner.py https://github.com/user/repo/wiki/Dependencies")
-            print("Example: python scanner.py <url> output.csv")
+            print("Example: python scanner.py <url> output.csv --no-json")
             print("\nOr set DEFAULT_URL variable in scanner.py")
             sys.exit(1)
         
@@ -886,18 +1716,22 @@ def main():
         else:
             logger.info("Scan completed successfully")
         
-        try:
-            output = json.dumps(results, indent=2)
-            print(output)
-            sys.stdout.flush()
-        except Exception as e:
-            logger.error(f"Error serializing results to JSON: {e}", exc_info=True)
-            print(json.dumps({
-                'url': url,
-                'error': 'Failed to serialize results',
-                'dependencies': [],
-                'summary': {'total': 0, 'by_type': {}}
-            }, indent=2))
+        if no_json:
+            summary = results.get('summary') or {}
+            print(f"Found {summary.get('total', 0)} dependencies")
+        else:
+            try:
+                output = _json_dumps(results)
+                print(output)
+                sys.stdout.flush()
+            except Exception as e:
+                logger.error(f"Error serializing results to JSON: {e}", exc_info=True)
+                print(_json_dumps({
+                    'url': url,
+                    'error': 'Failed to serialize results',
+                    'dependencies': [],
+                    'summary': {'total': 0, 'by_type': {}}
+                }))
         
         if csv_filename:
             try: